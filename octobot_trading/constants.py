@@ -79,11 +79,22 @@ EXCHANGE_SOCKS_PROXY_AUTHENTICATED_URL = os.getenv("EXCHANGE_SOCKS_PROXY_AUTHENT
 ENABLE_CCXT_VERBOSE = os_util.parse_boolean_environment_var("ENABLE_CCXT_VERBOSE", "False")
 ENABLE_CCXT_RATE_LIMIT = os_util.parse_boolean_environment_var("ENABLE_CCXT_RATE_LIMIT", "True")
 ENABLE_CCXT_REQUESTS_COUNTER = os_util.parse_boolean_environment_var("ENABLE_CCXT_REQUESTS_COUNTER", "False")
+# share http connections pool between ccxt clients instead of creating one per client
+# note: only applies to clients created from a running event loop, others use their own connections pool
+ENABLE_CCXT_SHARED_CONNECTOR = os_util.parse_boolean_environment_var("ENABLE_CCXT_SHARED_CONNECTOR", "False")
+# shared connector pool limits (aiohttp defaults), applied to all ccxt clients at once: unlike per client pools,
+# CCXT_SHARED_CONNECTOR_LIMIT simultaneous connections are shared between every exchange. 0 means no limit
+CCXT_SHARED_CONNECTOR_LIMIT = int(os.getenv("CCXT_SHARED_CONNECTOR_LIMIT", "100"))
+CCXT_SHARED_CONNECTOR_LIMIT_PER_HOST = int(os.getenv("CCXT_SHARED_CONNECTOR_LIMIT_PER_HOST", "0"))
 CCXT_DEFAULT_CACHE_LIMIT = int(os.getenv("CCXT_DEFAULT_CACHE_LIMIT", "1000"))  # 1000: default ccxt value
 CCXT_TRADES_CACHE_LIMIT = int(os.getenv("CCXT_TRADES_CACHE_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_ORDERS_CACHE_LIMIT = int(os.getenv("CCXT_ORDERS_CACHE_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_OHLCV_CACHE_LIMIT = int(os.getenv("CCXT_OHLCV_CACHE_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
+# also store parsed ccxt markets on disk to avoid fetching them again on each start
+# note: cache files (up to a few MB per exchange) are read and written synchronously, from the event loop
+ENABLE_CCXT_MARKETS_DISK_CACHE = os_util.parse_boolean_environment_var("ENABLE_CCXT_MARKETS_DISK_CACHE", "False")
+CCXT_MARKETS_DISK_CACHE_FOLDER = os.path.join(commons_constants.USER_FOLDER, "markets_cache")
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
 MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
 STORAGE_ORIGIN_VALUE = "origin_value"
@@ -18,13 +18,20 @@ import aiohttp_socks
 import os
 import ssl
 import aiohttp
-import copy
+import cachetools
+import functools
 import logging
+import types
 import typing
 import ccxt
 import ccxt.pro as ccxt_pro
 import ccxt.async_support as async_ccxt
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+import octobot_commons.constants as commons_constants
 import octobot_commons.time_frame_manager as time_frame_manager
 import octobot_commons.aiohttp_util as aiohttp_util
 import octobot_commons.logging as commons_logging
@@ -37,6 +44,29 @@ import octobot_trading.exchanges.config.proxy_config as proxy_config_import
 import octobot_trading.exchanges.util.exchange_util as exchange_util
 
 
+_ACTIVE_KEY = enums.ExchangeConstantsMarketStatusColumns.ACTIVE.value
+_TAKER_KEY = enums.ExchangeConstantsMarketPropertyColumns.TAKER.value
+_MAKER_KEY = enums.ExchangeConstantsMarketPropertyColumns.MAKER.value
+_FEE_KEY = enums.ExchangeConstantsMarketPropertyColumns.FEE.value
+_CONTRACT_SIZE_KEY = ccxt_enums.ExchangeConstantsMarketStatusCCXTColumns.CONTRACT_SIZE.value
+_URLS_KEY = ccxt_enums.ExchangeColumns.URLS.value
+
+# read-only: login options are shared by every client
+_SPOT_LOGIN_OPTIONS = types.MappingProxyType({'defaultType': 'spot'})
+_FUTURE_LOGIN_OPTIONS = types.MappingProxyType({'defaultType': 'future'})
+_MARGIN_LOGIN_OPTIONS = types.MappingProxyType({'defaultType': 'margin'})
+
+# short-lived symbols and time frames by client, entries are only used while the client attributes
+# they have been computed from are unchanged
+_CLIENT_VALUES_CACHE_TIME = commons_constants.MINUTE_TO_SECONDS
+_SYMBOLS_BY_CLIENT = cachetools.TTLCache(maxsize=100, ttl=_CLIENT_VALUES_CACHE_TIME)
+_TIME_FRAMES_BY_CLIENT = cachetools.TTLCache(maxsize=100, ttl=_CLIENT_VALUES_CACHE_TIME)
+
+# (shared aiohttp connector, ids of the clients using it) by ssl config by event loop,
+# used when ENABLE_CCXT_SHARED_CONNECTOR is set. Connectors are closed when their last client is closed
+_SHARED_CONNECTORS_BY_LOOP = {}
+
+
 def create_client(
     exchange_class, exchange_manager, logger, options, headers,
     additional_config, should_authenticate, unauthenticated_exchange_fallback=None,
@@ -108,26 +138,46 @@ def create_client(
     return client, is_authenticated
 
 
+# values to restore on closed clients, mutable values are copied for each client
+_EMPTY_CLIENT_STATE_TEMPLATE = {
+    'markets': {},
+    'markets_by_id': {},
+    'ids': [],
+    'last_json_response': {},
+    'last_http_response': "",
+    'last_response_headers': {},
+    'markets_loading': None,
+    'currencies': {},
+    'baseCurrencies': {},
+    'quoteCurrencies': {},
+    'currencies_by_id': {},
+    'codes': [],
+    'symbols': {},
+    'accounts': [],
+    'accounts_by_id': {},
+    'ohlcvs': {},
+    'trades': {},
+    'orderbooks': {},
+}
+
+
 async def close_client(client):
     await client.close()
-    client.markets = {}
-    client.markets_by_id = {}
-    client.ids = []
-    client.last_json_response = {}
-    client.last_http_response = ""
-    client.last_response_headers = {}
-    client.markets_loading = None
-    client.currencies = {}
-    client.baseCurrencies = {}
-    client.quoteCurrencies = {}
-    client.currencies_by_id = {}
-    client.codes = []
-    client.symbols = {}
-    client.accounts = []
-    client.accounts_by_id = {}
-    client.ohlcvs = {}
-    client.trades = {}
-    client.orderbooks = {}
+    client.__dict__.update({
+        key: value.copy() if hasattr(value, "copy") else value
+        for key, value in _EMPTY_CLIENT_STATE_TEMPLATE.items()
+    })
+    clear_client_values_cache(client)
+
+
+def clear_client_values_cache(client):
+    """
+    Forgets cached symbols and time frames of the given client
+    """
+    client_id = id(client)
+    for active_only in (True, False):
+        _SYMBOLS_BY_CLIENT.pop((client_id, active_only), None)
+    _TIME_FRAMES_BY_CLIENT.pop(client_id, None)
 
 
 def get_unauthenticated_exchange(
@@ -168,80 +218,181 @@ def set_sandbox_mode(exchange_connector, is_sandboxed):
 
 
 def load_markets_from_cache(client, market_filter: typing.Union[None, typing.Callable[[dict], bool]] = None):
+    markets = ccxt_clients_cache.get_exchange_parsed_markets(_cached_client_key(client))
+    # set_markets does not mutate the given markets list: no need to copy it when not filtering
     client.set_markets(
-        market
-        for market in ccxt_clients_cache.get_exchange_parsed_markets(ccxt_clients_cache.get_client_key(client))
-        if market_filter is None or market_filter(market)
+        markets if market_filter is None else [market for market in markets if market_filter(market)]
     )
 
 
+async def load_clients_markets_concurrently(clients: list, reload: bool = False) -> list:
+    """
+    Loads markets of each client at the same time instead of waiting for each exchange one after the other.
+    Markets cache is used when available unless reload is True.
+    :return: the loaded markets or the raised error of each client, in the same order as clients
+    """
+    return await asyncio.gather(
+        *(_load_client_markets(client, reload) for client in clients),
+        return_exceptions=True
+    )
+
+
+async def _load_client_markets(client, reload: bool) -> dict:
+    if not reload:
+        try:
+            load_markets_from_cache(client)
+            return client.markets
+        except KeyError:
+            pass
+    await client.load_markets(reload=reload)
+    set_markets_cache(client)
+    return client.markets
+
+
 def set_markets_cache(client):
     if client.markets:
         ccxt_clients_cache.set_exchange_parsed_markets(
-            ccxt_clients_cache.get_client_key(client), copy.deepcopy(list(client.markets.values()))
+            _cached_client_key(client), _copied_markets(client.markets.values())
         )
 
 
+def _copied_markets(markets) -> list:
+    if orjson is not None:
+        # orjson round trip is the fastest way to copy parsed markets
+        try:
+            return orjson.loads(orjson.dumps(list(markets)))
+        except TypeError:
+            # unexpected non-serializable market value
+            pass
+    return [_clone_market(market) for market in markets]
+
+
+def _clone_market(value):
+    # parsed markets only contain dicts, lists and immutable values: no need for copy.deepcopy memo and dispatch
+    if isinstance(value, dict):
+        return {key: _clone_market(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_clone_market(val) for val in value]
+    return value
+
+
+def _cached_client_key(client) -> str:
+    # cache key depends on api urls which are replaced when enabling sandbox mode: recompute it when they change
+    api_urls = client.urls.get('api')
+    cached_api_urls, key = getattr(client, "octobot_cache_key", (None, None))
+    if key is None or cached_api_urls is not api_urls:
+        key = ccxt_clients_cache.get_client_key(client)
+        client.octobot_cache_key = (api_urls, key)
+    return key
+
+
 def get_ccxt_client_login_options(exchange_manager):
     """
-    :return: ccxt client login option dict, can be overwritten to custom exchange login
+    :return: read-only ccxt client login option mapping, can be overwritten to custom exchange login
     """
     if exchange_manager.is_future:
-        return {'defaultType': 'future'}
+        return _FUTURE_LOGIN_OPTIONS
     if exchange_manager.is_margin:
-        return {'defaultType': 'margin'}
-    return {'defaultType': 'spot'}
+        return _MARGIN_LOGIN_OPTIONS
+    return _SPOT_LOGIN_OPTIONS
 
 
-def get_symbols(client, active_only) -> set[str]:
-    try:
-        if active_only:
-            return set(
-                symbol
-                for symbol in client.symbols
-                if client.markets.get(symbol, {}).get(
-                    enums.ExchangeConstantsMarketStatusColumns.ACTIVE.value, True
-                ) in (True, None)
-            )
-        return set(client.symbols)
-    except (AttributeError, TypeError):
+def get_symbols(client, active_only) -> frozenset[str]:
+    """
+    :return: the client symbols as a frozenset shared between callers (never edit it, copy it into a set instead).
+    Values are cached and recomputed when client.symbols or client.markets are replaced, which is the case
+    when markets are loaded, or when the client is closed. Call clear_client_values_cache after editing markets
+    in place: the cached value would otherwise remain in use for up to _CLIENT_VALUES_CACHE_TIME seconds.
+    """
+    return _get_cached_client_value(
+        _SYMBOLS_BY_CLIENT, (id(client), active_only),
+        (getattr(client, "symbols", None), getattr(client, "markets", None)),
+        _get_symbols, client, active_only
+    )
+
+
+def _get_symbols(client, active_only) -> frozenset[str]:
+    symbols = getattr(client, "symbols", None)
+    markets = getattr(client, "markets", None)
+    if not symbols or (active_only and not isinstance(markets, dict)):
         # ccxt exchange load_markets failed
-        return set()
+        return frozenset()
+    if active_only:
+        return frozenset(
+            symbol
+            for symbol in symbols
+            if (market := markets.get(symbol)) is None or market.get(_ACTIVE_KEY, True) in (True, None)
+        )
+    return frozenset(symbols)
 
 
-def get_time_frames(client):
-    try:
-        if isinstance(client, ccxt_pro.Exchange):
-            # ccxt pro exchanges might have different timeframes in options
-            options_time_frames = client.safe_value(client.options, 'timeframes')
-            if options_time_frames:
-                values = set([
-                    time_frame
-                    for time_frame in options_time_frames
-                    if time_frame_manager.is_time_frame(time_frame)
-                ])
-                if values:
-                    return values
-        # use normal client timeframes (values of rest exchange)
-        return set(client.timeframes)
-    except (AttributeError, TypeError):
+def get_time_frames(client) -> frozenset[str]:
+    """
+    :return: the client time frames as a frozenset shared between callers, cached like get_symbols values
+    """
+    options = getattr(client, "options", None)
+    return _get_cached_client_value(
+        _TIME_FRAMES_BY_CLIENT, id(client),
+        (getattr(client, "timeframes", None), options.get('timeframes') if isinstance(options, dict) else None),
+        _get_time_frames, client
+    )
+
+
+def _get_time_frames(client) -> frozenset[str]:
+    if _is_pro_client(client):
+        # ccxt pro exchanges might have different timeframes in options
+        options_time_frames = client.safe_value(client.options, 'timeframes')
+        if options_time_frames:
+            values = frozenset(
+                time_frame
+                for time_frame in options_time_frames
+                if time_frame_manager.is_time_frame(time_frame)
+            )
+            if values:
+                return values
+    # use normal client timeframes (values of rest exchange)
+    if not (time_frames := getattr(client, "timeframes", None)):
         # ccxt exchange describe() is invalid
-        return set()
+        return frozenset()
+    return frozenset(time_frames)
+
+
+def _is_pro_client(client) -> bool:
+    # client class never changes: only check it once
+    is_pro = getattr(client, "octobot_is_pro", None)
+    if is_pro is None:
+        is_pro = client.octobot_is_pro = isinstance(client, ccxt_pro.Exchange)
+    return is_pro
+
+
+def _get_cached_client_value(cache, key, sources: tuple, factory, *args):
+    try:
+        cached_sources, value = cache[key]
+        if all(cached is source for cached, source in zip(cached_sources, sources)):
+            return value
+    except KeyError:
+        pass
+    value = factory(*args)
+    cache[key] = (sources, value)
+    return value
 
 
 def get_exchange_pair(client, pair) -> str:
-    if pair in client.symbols:
-        try:
-            return client.market(pair)["id"]
-        except KeyError:
-            pass
-    raise ValueError(f'{pair} is not supported')
+    return get_market_fields(client, pair, ("id", ))[0]
 
 
 def get_pair_cryptocurrency(client, pair) -> str:
-    if pair in client.symbols:
+    return get_market_fields(client, pair, ("base", ))[0]
+
+
+def get_market_fields(client, pair, fields: tuple) -> tuple:
+    """
+    :return: the values of the given fields from the pair market, in the same order
+    """
+    # markets are indexed by symbol: no need to go through client.symbols and client.market()
+    if (market := client.markets.get(pair) if client.markets else None) is not None:
         try:
-            return client.market(pair)["base"]
+            return tuple(market[field] for field in fields)
         except KeyError:
             pass
     raise ValueError(f'{pair} is not supported')
@@ -252,20 +403,15 @@ def get_contract_size(client, pair) -> float:
 
 
 def get_market_status_contract_size(market_status: dict) :
-    return market_status[ccxt_enums.ExchangeConstantsMarketStatusCCXTColumns.CONTRACT_SIZE.value]
+    return market_status[_CONTRACT_SIZE_KEY]
 
 
 def get_fees(market_status) -> dict:
+    default_fees = constants.CONFIG_DEFAULT_FEES
     return {
-        enums.ExchangeConstantsMarketPropertyColumns.TAKER.value:
-            market_status.get(enums.ExchangeConstantsMarketPropertyColumns.TAKER.value,
-                              constants.CONFIG_DEFAULT_FEES),
-        enums.ExchangeConstantsMarketPropertyColumns.MAKER.value:
-            market_status.get(enums.ExchangeConstantsMarketPropertyColumns.MAKER.value,
-                              constants.CONFIG_DEFAULT_FEES),
-        enums.ExchangeConstantsMarketPropertyColumns.FEE.value:
-            market_status.get(enums.ExchangeConstantsMarketPropertyColumns.FEE.value,
-                              constants.CONFIG_DEFAULT_FEES)
+        _TAKER_KEY: market_status.get(_TAKER_KEY, default_fees),
+        _MAKER_KEY: market_status.get(_MAKER_KEY, default_fees),
+        _FEE_KEY: market_status.get(_FEE_KEY, default_fees),
     }
 
 
@@ -274,8 +420,7 @@ def add_headers(client, headers_dict):
     Add new headers to ccxt client
     :param headers_dict: the additional header keys and values as dict
     """
-    for header_key, header_value in headers_dict.items():
-        client.headers[header_key] = header_value
+    client.headers.update(headers_dict)
 
 
 def add_options(client, options_dict):
@@ -283,18 +428,22 @@ def add_options(client, options_dict):
     Add new options to ccxt client
     :param options_dict: the additional option keys and values as dict
     """
-    for option_key, option_value in options_dict.items():
-        client.options[option_key] = option_value
+    client.options.update(options_dict)
 
 
 def converted_ccxt_common_errors(f):
+    # bind error classes at decoration time to avoid module attributes lookups on each call
+    ccxt_rate_limit_exceeded, ccxt_not_supported = ccxt.RateLimitExceeded, ccxt.NotSupported
+    rate_limit_exceeded, not_supported = errors.RateLimitExceeded, errors.NotSupported
+
+    @functools.wraps(f)
     async def converted_ccxt_common_errors_wrapper(*args, **kwargs):
         try:
             return await f(*args, **kwargs)
-        except ccxt.RateLimitExceeded as err:
-            raise errors.RateLimitExceeded(err) from err
-        except ccxt.NotSupported as err:
-            raise errors.NotSupported(err) from err
+        except ccxt_rate_limit_exceeded as err:
+            raise rate_limit_exceeded(err) from err
+        except ccxt_not_supported as err:
+            raise not_supported(err) from err
     return converted_ccxt_common_errors_wrapper
 
 
@@ -345,13 +494,100 @@ def _use_proxy_if_necessary(client, proxy_config: proxy_config_import.ProxyConfi
         client.session = aiohttp.ClientSession(
             loop=client.asyncio_loop, connector=connector, trust_env=client.aiohttp_trust_env
         )
+    elif constants.ENABLE_CCXT_SHARED_CONNECTOR and _has_event_loop(client):
+        # rewrite of async_ccxt.exchange.client.open() using a connector shared between clients
+        _init_ccxt_client_session_requirements(client)
+        if client.session:
+            # should not happen
+            asyncio.create_task(client.session.close())
+        # never set client.tcp_connector: it would be closed with the client
+        client.session = aiohttp.ClientSession(
+            loop=client.asyncio_loop, connector=_get_shared_connector(client), connector_owner=False,
+            trust_env=client.aiohttp_trust_env
+        )
+        _release_shared_connector_on_close(client)
+
+
+def _has_event_loop(client) -> bool:
+    if client.asyncio_loop is not None:
+        return True
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        # no running loop to bind the shared connector to: ccxt will create its own session in open()
+        return False
+
+
+def _release_shared_connector_on_close(client):
+    # clients can be closed from anywhere using client.close(): always release their shared connector
+    client_close = client.close
+
+    async def _close_and_release_shared_connector():
+        try:
+            await client_close()
+        finally:
+            await _release_shared_connector(client)
+
+    client.close = _close_and_release_shared_connector
+
+
+def _get_shared_connector(client) -> aiohttp.TCPConnector:
+    _forget_closed_loops_connectors()
+    connectors = _SHARED_CONNECTORS_BY_LOOP.setdefault(client.asyncio_loop, {})
+    # connectors can only be shared between clients using the same ssl config
+    ssl_config = (client.verify, client.cafile)
+    connector, client_ids = connectors.get(ssl_config, (None, None))
+    if connector is None or connector.closed:
+        # same connector as in async_ccxt.exchange.client.open() with configurable limits
+        connector = aiohttp.TCPConnector(
+            ssl=client.ssl_context, loop=client.asyncio_loop, enable_cleanup_closed=True,
+            limit=constants.CCXT_SHARED_CONNECTOR_LIMIT,
+            limit_per_host=constants.CCXT_SHARED_CONNECTOR_LIMIT_PER_HOST,
+        )
+        client_ids = set()
+        connectors[ssl_config] = (connector, client_ids)
+    client_ids.add(id(client))
+    client.octobot_shared_connector_key = (client.asyncio_loop, ssl_config)
+    return connector
+
+
+async def _release_shared_connector(client):
+    loop, ssl_config = getattr(client, "octobot_shared_connector_key", (None, None))
+    if loop is None:
+        return
+    client.octobot_shared_connector_key = (None, None)
+    connectors = _SHARED_CONNECTORS_BY_LOOP.get(loop, {})
+    connector, client_ids = connectors.get(ssl_config, (None, set()))
+    client_ids.discard(id(client))
+    if connector is not None and not client_ids:
+        # last client using this connector: close it
+        connectors.pop(ssl_config)
+        if not connectors:
+            _SHARED_CONNECTORS_BY_LOOP.pop(loop, None)
+        await connector.close()
+
+
+async def close_shared_connectors():
+    """
+    Closes every shared connector of the current event loop, to be called when stopping every ccxt client
+    """
+    _forget_closed_loops_connectors()
+    for connector, _ in _SHARED_CONNECTORS_BY_LOOP.pop(asyncio.get_running_loop(), {}).values():
+        await connector.close()
+
+
+def _forget_closed_loops_connectors():
+    # transports of closed loops are already unusable: only drop references to their loop and connectors
+    for loop in [loop for loop in _SHARED_CONNECTORS_BY_LOOP if loop.is_closed()]:
+        _SHARED_CONNECTORS_BY_LOOP.pop(loop)
 
 
 def _init_ccxt_client_session_requirements(client):
     # from async_ccxt.exchange.client.open()
     if client.asyncio_loop is None:
         client.asyncio_loop = asyncio.get_running_loop()
-        client.throttle.loop = client.asyncio_loop
+        client.throttler.loop = client.asyncio_loop
 
     if client.ssl_context is None:
         # Create our SSL context object with our CA cert file
@@ -366,35 +602,31 @@ def _get_client_config(
 ):
     if auth_token:
         headers["Authorization"] = f"{auth_token_header_prefix or ''}{auth_token}"
-    config = {
+    return {
         'verbose': constants.ENABLE_CCXT_VERBOSE,
         'enableRateLimit': constants.ENABLE_CCXT_RATE_LIMIT,
         'timeout': constants.DEFAULT_REQUEST_TIMEOUT,
         'options': options,
-        'headers': headers
+        'headers': headers,
+        **({'apiKey': api_key} if api_key is not None else {}),
+        **({'secret': secret} if secret is not None else {}),
+        **({'password': password} if password is not None else {}),
+        **({'uid': uid} if uid is not None else {}),
+        **_get_custom_domain_config(exchange_class),
+        **(additional_config or {}),
     }
-    if api_key is not None:
-        config['apiKey'] = api_key
-    if secret is not None:
-        config['secret'] = secret
-    if password is not None:
-        config['password'] = password
-    if uid is not None:
-        config['uid'] = uid
-    config.update({**_get_custom_domain_config(exchange_class), **(additional_config or {})})
-    return config
 
 
 def _get_custom_domain_config(exchange_class):
     old, new = _get_replaced_custom_domains(exchange_class)
     if not (old and new):
         return {}
-    if url_config := exchange_class().describe()[ccxt_enums.ExchangeColumns.URLS.value]:
+    if url_config := exchange_class().describe()[_URLS_KEY]:
         commons_logging.get_logger(__name__).info(
             f"Using custom domain for {exchange_class.__name__}: {old} is replaced by {new}"
         )
         return {
-            ccxt_enums.ExchangeColumns.URLS.value: _get_patched_url_config(url_config, old, new)
+            _URLS_KEY: _get_patched_url_config(url_config, old, new)
         }
     return {}
 
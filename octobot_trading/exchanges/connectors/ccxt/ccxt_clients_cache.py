@@ -14,9 +14,21 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import cachetools
+import ccxt
+import hashlib
 import json
+import os
+import tempfile
+import time
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import octobot_commons.constants as commons_constants
+import octobot_commons.logging as commons_logging
+
+import octobot_trading.constants as constants
 
 
 # To avoid side effects related to a cache refresh at a fix time of the day every day,
@@ -24,16 +36,100 @@ import octobot_commons.constants as commons_constants
 # Use 30h and 18min as a period. It could be anything else as long as it doesn't make it so
 # that cache ends up refreshed approximately at the same time of the day
 _CACHE_TIME = commons_constants.HOURS_TO_SECONDS * 30 + commons_constants.MINUTE_TO_SECONDS * 18
-_MARKETS_BY_EXCHANGE = cachetools.TTLCache(maxsize=50, ttl=_CACHE_TIME)
+
+
+def _get_markets_expiration(_client_key, cached_markets, _now):
+    return cached_markets[1]
+
+
+# values are (markets, expiration time) tuples: markets read from disk should only be kept for the remaining
+# time of their disk cache and not for a new _CACHE_TIME period
+_MARKETS_BY_EXCHANGE = cachetools.TLRUCache(maxsize=50, ttu=_get_markets_expiration, timer=time.time)
 
 
 def get_client_key(client) -> str:
+    # always use json for keys: they should not depend on orjson availability
     return f"{client.__class__.__name__}:{json.dumps(client.urls.get('api'))}"
 
 
 def get_exchange_parsed_markets(client_key: str):
-    return _MARKETS_BY_EXCHANGE[client_key]
+    try:
+        return _MARKETS_BY_EXCHANGE[client_key][0]
+    except KeyError:
+        if not constants.ENABLE_CCXT_MARKETS_DISK_CACHE:
+            raise
+        # not in memory: use disk cache when available
+        markets, expiration = _read_disk_cached_markets(client_key)
+        _MARKETS_BY_EXCHANGE[client_key] = (markets, expiration)
+        return markets
 
 
 def set_exchange_parsed_markets(client_key: str, markets):
-    _MARKETS_BY_EXCHANGE[client_key] = markets
+    _MARKETS_BY_EXCHANGE[client_key] = (markets, time.time() + _CACHE_TIME)
+    if constants.ENABLE_CCXT_MARKETS_DISK_CACHE:
+        _write_disk_cached_markets(client_key, markets)
+
+
+def _get_disk_cache_path(client_key: str) -> str:
+    # client key contains urls: hash it to get a valid file name
+    class_name = client_key.split(":", 1)[0]
+    # markets parsed by another ccxt version should not be used: include ccxt version in hash
+    key_hash = hashlib.sha256(f"{ccxt.__version__}:{client_key}".encode()).hexdigest()[:16]
+    return os.path.join(constants.CCXT_MARKETS_DISK_CACHE_FOLDER, f"{class_name}_{key_hash}.json")
+
+
+def _read_disk_cached_markets(client_key: str) -> (list, float):
+    """
+    :return: the cached markets and the time at which their cache expires
+    :raise KeyError: when the markets are not cached on disk or when the cache is expired
+    """
+    path = _get_disk_cache_path(client_key)
+    try:
+        expiration = os.path.getmtime(path) + _CACHE_TIME
+        if time.time() > expiration:
+            raise KeyError(client_key)
+        with open(path, "rb") as cache_file:
+            return _loads(cache_file.read()), expiration
+    except (OSError, ValueError) as err:
+        if not isinstance(err, FileNotFoundError):
+            commons_logging.get_logger(__name__).warning(
+                f"Ignored invalid markets cache file {path}: {err} ({err.__class__.__name__})"
+            )
+        raise KeyError(client_key) from err
+
+
+def _write_disk_cached_markets(client_key: str, markets: list):
+    path = _get_disk_cache_path(client_key)
+    tmp_path = None
+    try:
+        os.makedirs(constants.CCXT_MARKETS_DISK_CACHE_FOLDER, exist_ok=True)
+        # use a unique temporary file: other processes might be writing the same cache at the same time
+        with tempfile.NamedTemporaryFile(
+            dir=constants.CCXT_MARKETS_DISK_CACHE_FOLDER, suffix=".tmp", delete=False
+        ) as cache_file:
+            tmp_path = cache_file.name
+            cache_file.write(_dumps(markets))
+        # replace at once to never expose a partially written file to other processes
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as err:
+        commons_logging.get_logger(__name__).warning(
+            f"Failed to save markets cache file {path}: {err} ({err.__class__.__name__})"
+        )
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _dumps(value) -> bytes:
+    # orjson is much faster when available
+    if orjson is None:
+        return json.dumps(value).encode()
+    return orjson.dumps(value)
+
+
+def _loads(value: bytes):
+    if orjson is None:
+        return json.loads(value)
+    return orjson.loads(value)
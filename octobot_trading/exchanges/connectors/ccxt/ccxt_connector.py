@@ -208,10 +208,13 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
                 else:
                     raise
 
-    def get_client_symbols(self, active_only=True) -> set[str]:
+    def get_client_symbols(self, active_only=True) -> frozenset[str]:
+        """
+        :return: the read-only set of the client symbols, see ccxt_client_util.get_symbols
+        """
         return ccxt_client_util.get_symbols(self.client, active_only)
 
-    def get_client_time_frames(self):
+    def get_client_time_frames(self) -> frozenset[str]:
         return ccxt_client_util.get_time_frames(self.client)
 
     @classmethod
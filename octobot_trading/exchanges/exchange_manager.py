@@ -23,6 +23,7 @@ import octobot_commons.timestamp_util as timestamp_util
 
 import octobot_trading.exchange_channel as exchange_channel
 import octobot_trading.exchanges as exchanges
+import octobot_trading.exchanges.connectors.ccxt.ccxt_client_util as ccxt_client_util
 import octobot_trading.personal_data as personal_data
 import octobot_trading.exchange_data as exchange_data
 import octobot_trading.constants as constants
@@ -88,6 +89,9 @@ class ExchangeManager(util.Initializable):
 
         self.debug_info = {}
 
+        # decrypted credentials by exchange name, associated to the config values they are computed from
+        self._credentials_by_exchange: dict[str, tuple[tuple, tuple]] = {}
+
     async def initialize_impl(self, exchange_config_by_exchange: typing.Optional[dict[str, dict]]):
         await exchanges.create_exchanges(self, exchange_config_by_exchange)
         if self.is_storage_enabled():
@@ -146,6 +150,12 @@ class ExchangeManager(util.Initializable):
             exchanges.Exchanges.instance().del_exchange(
                 self.exchange.name, self.id, should_warn=warning_on_missing_elements
             )
+            if constants.ENABLE_CCXT_SHARED_CONNECTOR and not exchanges.Exchanges.instance().exchanges:
+                # last exchange: close remaining shared connections
+                try:
+                    await ccxt_client_util.close_shared_connectors()
+                except Exception as err:
+                    self.logger.exception(err, True, f"Error when closing shared ccxt connectors: {err}")
             self.exchange.exchange_manager = None
             self.exchange = None
         if self.exchange_personal_data is not None:
@@ -317,6 +327,22 @@ class ExchangeManager(util.Initializable):
         if self.ignore_config or not self.should_decrypt_token() or self.without_auth:
             return "", "", "", "", ""
         config_exchange = self.config[common_constants.CONFIG_EXCHANGES][exchange_name]
+        # decrypting credentials is slow: reuse them as long as their config values are unchanged
+        config_values = tuple(
+            config_exchange.get(key)
+            for key in (
+                common_constants.CONFIG_EXCHANGE_KEY, common_constants.CONFIG_EXCHANGE_SECRET,
+                common_constants.CONFIG_EXCHANGE_PASSWORD, common_constants.CONFIG_EXCHANGE_UID,
+                common_constants.CONFIG_EXCHANGE_ACCESS_TOKEN,
+            )
+        )
+        cached_config_values, credentials = self._credentials_by_exchange.get(exchange_name, (None, None))
+        if credentials is None or cached_config_values != config_values:
+            credentials = self._decrypt_exchange_credentials(config_exchange)
+            self._credentials_by_exchange[exchange_name] = (config_values, credentials)
+        return credentials
+
+    def _decrypt_exchange_credentials(self, config_exchange: dict) -> tuple:
         key = configuration.decrypt_element_if_possible(
             common_constants.CONFIG_EXCHANGE_KEY, config_exchange, None
         )
@@ -731,18 +731,20 @@ class RestExchange(abstract_exchange.AbstractExchange):
     def get_rate_limit(self):
         return self.connector.get_rate_limit()
 
-    def get_all_available_symbols(self, active_only=True) -> set[str]:
+    def get_all_available_symbols(self, active_only=True) -> frozenset[str]:
         """
-        :return: the list of all symbols supported by the exchange
+        :return: the read-only set of all symbols supported by the exchange, shared between callers:
+        copy it into a set before editing it
         """
         return self.connector.get_client_symbols(
             active_only=False if self.INCLUDE_DISABLED_SYMBOLS_IN_AVAILABLE_SYMBOLS else active_only
         )
 
-    async def get_all_tradable_symbols(self, active_only=True) -> set[str]:
+    async def get_all_tradable_symbols(self, active_only=True) -> frozenset[str]:
         """
         Override if the exchange is not allowing trading for all available symbols (ex: MEXC)
-        :return: the list of all symbols supported by the exchange that can currently be traded through API
+        :return: the read-only set of all symbols supported by the exchange that can currently be traded through API:
+        copy it into a set before editing it
         """
         return self.get_all_available_symbols(active_only=active_only)
 
@@ -18,6 +18,7 @@
 from octobot_trading.modes import abstract_trading_mode
 from octobot_trading.modes.abstract_trading_mode import (
     AbstractTradingMode,
+    invalidate_tentacle_config_cache,
 )
 
 from octobot_trading.modes import channel
@@ -81,6 +82,7 @@ __all__ = [
     "AbstractTradingModeProducer",
     "AbstractTradingMode",
     "AbstractTradingModeConsumer",
+    "invalidate_tentacle_config_cache",
     "AbstractScriptedTradingMode",
     "AbstractScriptedTradingModeProducer",
     "Context",
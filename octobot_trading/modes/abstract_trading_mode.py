@@ -14,10 +14,16 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import abc
+import asyncio
 import contextlib
 import decimal
 import copy
+import itertools
+import os
 import typing
+import weakref
+
+import cachetools
 
 import octobot_commons.constants as common_constants
 import octobot_commons.enums as common_enums
@@ -44,6 +50,70 @@ import octobot_trading.exchanges.util.exchange_util as exchange_util
 import octobot_trading.signals as signals
 
 
+_TENTACLE_CONFIG_CACHE_TIME = common_constants.MINUTE_TO_SECONDS
+# (tentacles setup config, config file version, config) by (id(tentacles setup config), trading mode class)
+_TENTACLE_CONFIG_BY_CLASS = cachetools.TTLCache(maxsize=256, ttl=_TENTACLE_CONFIG_CACHE_TIME)
+
+
+def invalidate_tentacle_config_cache() -> None:
+    """
+    Clears cached trading modes tentacle configs. Updated tentacle config files are detected automatically
+    and configs from tentacles manager config proxies are never cached: only required to force a config reload
+    """
+    _TENTACLE_CONFIG_BY_CLASS.clear()
+
+
+def _get_tentacle_config_file_version(
+    tentacles_setup_config: tm_configuration.TentaclesSetupConfiguration, klass
+) -> tuple:
+    # tentacle configs are written in the profile specific config file (ex: from the web interface):
+    # any change of this file changes its version
+    config_path = tm_configuration.get_profile_config_specific_file_path(tentacles_setup_config, klass)
+    try:
+        return config_path, os.path.getmtime(config_path)
+    except OSError:
+        # no specific config: the reference config is used
+        return config_path, None
+
+
+def _is_file_system_tentacle_config() -> bool:
+    # pylint: disable=protected-access
+    # tentacles manager has no public api to get the current tentacle config proxy
+    tentacle_configuration = tm_configuration.tentacle_configuration
+    return tentacle_configuration._GET_CONFIG_PROXY is tentacle_configuration._get_config_from_file_system
+
+
+def _get_cached_tentacle_config(tentacles_setup_config: tm_configuration.TentaclesSetupConfiguration, klass) -> dict:
+    """
+    :return: a copy of the cached tentacle config: cached values can't be altered by callers
+    """
+    if not _is_file_system_tentacle_config():
+        # configs from a config proxy (ex: local_tentacle_config_proxy) can't be checked for updates: don't cache
+        return tentacles_manager_api.get_tentacle_config(tentacles_setup_config, klass)
+    key = (id(tentacles_setup_config), klass)
+    config_file_version = _get_tentacle_config_file_version(tentacles_setup_config, klass)
+    try:
+        cached_tentacles_setup_config, cached_config_file_version, config = _TENTACLE_CONFIG_BY_CLASS[key]
+        # id() can be reused by another tentacles setup config once the cached one is garbage collected
+        if cached_tentacles_setup_config is tentacles_setup_config \
+                and cached_config_file_version == config_file_version:
+            return copy.deepcopy(config)
+    except KeyError:
+        pass
+    config = tentacles_manager_api.get_tentacle_config(tentacles_setup_config, klass)
+    _TENTACLE_CONFIG_BY_CLASS[key] = (tentacles_setup_config, config_file_version, config)
+    return copy.deepcopy(config)
+
+
+# parent trading mode classes by higher_parent_class_limit by trading mode class
+_PARENT_TRADING_MODE_CLASSES_BY_CLASS = weakref.WeakKeyDictionary()
+# producers and consumers to notify in reload_config
+_RELOADABLE_ELEMENT_TYPES = (
+    abstract_mode_consumer.AbstractTradingModeConsumer,
+    abstract_mode_producer.AbstractTradingModeProducer,
+)
+
+
 class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
     __metaclass__ = abc.ABCMeta
     USER_INPUT_TENTACLE_TYPE = common_enums.UserInputTentacleTypes.TRADING_MODE
@@ -52,6 +122,12 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
 
     MODE_PRODUCER_CLASSES = []
     MODE_CONSUMER_CLASSES = []
+    # returned by get_is_cryptocurrency_wildcard, get_is_symbol_wildcard and get_is_time_frame_wildcard
+    IS_CRYPTOCURRENCY_WILDCARD = True
+    IS_SYMBOL_WILDCARD = True
+    IS_TIME_FRAME_WILDCARD = True
+    # returned by get_supported_exchange_types
+    SUPPORTED_EXCHANGE_TYPES = (enums.ExchangeTypes.SPOT, )
     # maximum seconds before sending a trading signal if orders are slow to create on exchange
     TRADING_SIGNAL_TIMEOUT = 10
     REQUIRE_TRADES_HISTORY = False   # set True when this trading mode needs the trade history to operate
@@ -64,13 +140,16 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
 
     def __init__(self, config, exchange_manager):
         super().__init__()
-        self.logger = logging.get_logger(self.get_name())
+        self.logger = self._get_class_logger()
 
         # Global OctoBot configuration
         self.config: dict = config
 
         # Mode related exchange manager instance
         self.exchange_manager = exchange_manager
+        # Exchange manager values set when building the exchange: they don't change afterwards
+        self._is_backtesting: bool = exchange_manager.is_backtesting if exchange_manager else False
+        self._is_future: bool = exchange_manager.is_future if exchange_manager else False
 
         # The id of the OctoBot using this trading mode
         self.bot_id: str = None
@@ -112,6 +191,13 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         self.is_health_check_enabled = False
         self._last_health_check_time = 0
 
+    @classmethod
+    def _get_class_logger(cls):
+        # loggers only depend on the class name: share them between instances of the same class
+        if (logger := cls.__dict__.get("_cached_logger")) is None:
+            logger = cls._cached_logger = logging.get_logger(cls.get_name())
+        return logger
+
     # Used to know the current state of the trading mode.
     # Overwrite in subclasses
     def get_current_state(self) -> tuple:
@@ -125,30 +211,28 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         """
         :return: True if the mode is not cryptocurrency dependant else False
         """
-        return True
+        return cls.IS_CRYPTOCURRENCY_WILDCARD
 
     @classmethod
     def get_is_symbol_wildcard(cls) -> bool:
         """
         :return: True if the mode is not symbol dependant else False
         """
-        return True
+        return cls.IS_SYMBOL_WILDCARD
 
     @classmethod
     def get_is_time_frame_wildcard(cls) -> bool:
         """
         :return: True if the mode is not time_frame dependant else False
         """
-        return True
+        return cls.IS_TIME_FRAME_WILDCARD
 
     @classmethod
     def get_supported_exchange_types(cls) -> list:
         """
         :return: The list of supported exchange types
         """
-        return [
-            enums.ExchangeTypes.SPOT
-        ]
+        return list(cls.SUPPORTED_EXCHANGE_TYPES)
 
     def get_mode_producer_classes(self) -> list:
         return self.MODE_PRODUCER_CLASSES
@@ -160,7 +244,7 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         """
         :return: True if the mode should be emitting trading signals according to configuration and trading environment
         """
-        return not self.exchange_manager.is_backtesting and mode_config.is_trading_signal_emitter(self)
+        return not self._is_backtesting and mode_config.is_trading_signal_emitter(self)
 
     def get_trading_signal_identifier(self) -> str:
         """
@@ -195,11 +279,18 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
 
     @classmethod
     def get_parent_trading_mode_classes(cls, higher_parent_class_limit=None) -> list:
-        return [
-            class_type
-            for class_type in cls.mro()
-            if (higher_parent_class_limit if higher_parent_class_limit else AbstractTradingMode) in class_type.mro()
-        ]
+        # mro can't change: compute parent classes only once per class and limit
+        parent_classes_by_limit = _PARENT_TRADING_MODE_CLASSES_BY_CLASS.setdefault(cls, {})
+        try:
+            parent_classes = parent_classes_by_limit[higher_parent_class_limit]
+        except KeyError:
+            parent_classes = parent_classes_by_limit[higher_parent_class_limit] = tuple(
+                class_type
+                for class_type in cls.mro()
+                if (higher_parent_class_limit if higher_parent_class_limit else AbstractTradingMode)
+                in class_type.mro()
+            )
+        return list(parent_classes)
 
     @staticmethod
     def is_backtestable() -> bool:
@@ -228,10 +319,10 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         """
         Stops all producers and consumers
         """
-        for producer in self.producers:
-            await producer.stop()
-        for consumer in self.consumers:
-            await consumer.stop()
+        await asyncio.gather(
+            *(producer.stop() for producer in self.producers),
+            *(consumer.stop() for consumer in self.consumers),
+        )
         self.exchange_manager = None
 
     async def create_producers(self, auto_start) -> list:
@@ -239,10 +330,10 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         Creates the instance of producers listed in MODE_PRODUCER_CLASSES
         :return: the list of producers created
         """
-        return [
-            await self._create_mode_producer(mode_producer_class, auto_start)
+        return await self._create_elements_concurrently(
+            self._create_mode_producer(mode_producer_class, auto_start)
             for mode_producer_class in self.get_mode_producer_classes()
-        ]
+        )
 
     async def _create_mode_producer(self, mode_producer_class, auto_start):
         """
@@ -269,15 +360,40 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         Creates the instance of consumers listed in MODE_CONSUMER_CLASSES
         :return: the list of consumers created
         """
-        base_consumers = [
-            await self._create_mode_consumer(mode_consumer_class)
+        base_consumers = await self._create_elements_concurrently(
+            self._create_mode_consumer(mode_consumer_class)
             for mode_consumer_class in self.get_mode_consumer_classes()
-        ]
+        )
         if user_input_consumer := await self._create_user_input_consumer():
             base_consumers.append(user_input_consumer)
 
         return base_consumers
 
+    async def _create_elements_concurrently(self, creations) -> list:
+        """
+        Runs the given producers or consumers creations at the same time
+        :return: the created elements, in the same order as creations
+        :raise: the first creation error, once the successfully created elements are stopped
+        """
+        created_elements = await asyncio.gather(*creations, return_exceptions=True)
+        creation_errors = [
+            element for element in created_elements if isinstance(element, BaseException)
+        ]
+        if creation_errors:
+            stop_results = await asyncio.gather(
+                *(
+                    element.stop()
+                    for element in created_elements
+                    if not isinstance(element, BaseException)
+                ),
+                return_exceptions=True
+            )
+            for stop_error in stop_results:
+                if isinstance(stop_error, BaseException):
+                    self.logger.exception(stop_error, True, f"Error when stopping created element: {stop_error}")
+            raise creation_errors[0]
+        return list(created_elements)
+
     async def _create_user_input_consumer(self):
         try:
             import octobot_services.channel as services_channels
@@ -436,9 +552,8 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         if not self.trading_config:
             self.set_default_config()
         await self.load_and_save_user_inputs(bot_id)
-        for element in self.consumers + self.producers:
-            if isinstance(element, (abstract_mode_consumer.AbstractTradingModeConsumer,
-                                    abstract_mode_producer.AbstractTradingModeProducer)):
+        for element in itertools.chain(self.consumers, self.producers):
+            if isinstance(element, _RELOADABLE_ELEMENT_TYPES):
                 element.on_reload_config()
                 await element.init_user_inputs(False)
         self.logger.debug(f"Using config: {self.trading_config}")
@@ -451,7 +566,7 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
             self.init_user_inputs({})
 
     def update_config_if_necessary(self) -> bool:
-        if self.exchange_manager.is_backtesting:
+        if self._is_backtesting:
             try:
                 most_recent_config = self.get_historical_config()
                 if most_recent_config != self.trading_config:
@@ -512,7 +627,7 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
     def get_required_strategies_names_and_count(
         cls, tentacles_config: tm_configuration.TentaclesSetupConfiguration, trading_mode_config=None
     ):
-        config = trading_mode_config or tentacles_manager_api.get_tentacle_config(tentacles_config, cls)
+        config = trading_mode_config or _get_cached_tentacle_config(tentacles_config, cls)
         if constants.TRADING_MODE_REQUIRED_STRATEGIES in config:
             return config[constants.TRADING_MODE_REQUIRED_STRATEGIES], cls.get_required_strategies_count(config)
         raise Exception(f"'{constants.TRADING_MODE_REQUIRED_STRATEGIES}' is missing in configuration file")
@@ -521,7 +636,7 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
     def get_default_strategies(cls,
                                tentacles_config: tm_configuration.TentaclesSetupConfiguration,
                                trading_mode_config=None):
-        config = trading_mode_config or tentacles_manager_api.get_tentacle_config(tentacles_config, cls)
+        config = trading_mode_config or _get_cached_tentacle_config(tentacles_config, cls)
         if common_constants.TENTACLE_DEFAULT_CONFIG in config:
             return config[common_constants.TENTACLE_DEFAULT_CONFIG]
 
@@ -537,23 +652,23 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
 
     @classmethod
     def get_required_candles_count(cls, tentacles_setup_config: tm_configuration.TentaclesSetupConfiguration):
-        return tentacles_manager_api.get_tentacle_config(tentacles_setup_config, cls).get(
+        return _get_cached_tentacle_config(tentacles_setup_config, cls).get(
             constants.CONFIG_CANDLES_HISTORY_SIZE_KEY,
             common_constants.DEFAULT_IGNORED_VALUE
         )
 
     def ensure_supported(self, symbol):
-        if self.exchange_manager.is_future:
+        if self._is_future:
             try:
                 self.exchange_manager.exchange.pair_contracts[symbol].ensure_supported_configuration()
             except KeyError:
                 raise errors.ContractExistsError(f"Missing contract for {symbol}")
 
-    @contextlib.asynccontextmanager
-    async def remote_signal_publisher(self, symbol: str):
-        async with signals.remote_signal_publisher(self.exchange_manager, symbol, self.should_emit_trading_signal()) \
-             as signal_builder:
-            yield signal_builder
+    def remote_signal_publisher(self, symbol: str):
+        """
+        :return: the async context manager yielding the signal builder to use, None when signals are not emitted
+        """
+        return signals.remote_signal_publisher(self.exchange_manager, symbol, self.should_emit_trading_signal())
 
     async def create_order(self, order, loaded: bool = False, params: dict = None,
                            wait_for_creation=True,
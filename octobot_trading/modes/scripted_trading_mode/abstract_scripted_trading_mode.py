@@ -34,6 +34,7 @@ class AbstractScriptedTradingMode(abstract_trading_mode.AbstractTradingMode):
     TRADING_SCRIPT_MODULE = None
     BACKTESTING_SCRIPT_MODULE = None
     ALLOW_CUSTOM_TRIGGER_SOURCE = True
+    IS_SYMBOL_WILDCARD = False
 
     INITIALIZED_TRADING_PAIR_BY_BOT_ID = {}
 
@@ -76,10 +77,6 @@ class AbstractScriptedTradingMode(abstract_trading_mode.AbstractTradingMode):
                                                  optimization_campaign, backtesting_analysis_settings)
         return await cls.get_script_from_module(cls.BACKTESTING_SCRIPT_MODULE)(ctx)
 
-    @classmethod
-    def get_is_symbol_wildcard(cls) -> bool:
-        return False
-
     def get_script(self, live=True):
         return self._live_script if live else self._backtesting_script
 
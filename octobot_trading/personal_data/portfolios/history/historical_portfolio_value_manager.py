@@ -205,18 +205,18 @@ class HistoricalPortfolioValueManager(util.Initializable):
         if self.portfolio_manager.portfolio is None or self.portfolio_manager.portfolio.portfolio is None:
             self.logger.debug("Ignoring portfolio values in history: portfolio_manager.portfolio is not initialized")
             return
-        self.ending_portfolio = portfolio_util.filter_empty_values(portfolio_util.portfolio_to_float(
-            self.portfolio_manager.portfolio.portfolio
-        ))
+        self.ending_portfolio = portfolio_util.portfolio_to_float(
+            self.portfolio_manager.portfolio.portfolio, ignore_empty_values=True
+        )
         if self.starting_portfolio is None:
             if self.portfolio_manager.portfolio_value_holder.origin_portfolio is None \
                     or not self.portfolio_manager.portfolio_value_holder.origin_portfolio.portfolio:
                 # origin portfolio might not be initialized, use ending_portfolio
                 self.starting_portfolio = copy.deepcopy(self.ending_portfolio)
             else:
-                self.starting_portfolio = portfolio_util.filter_empty_values(portfolio_util.portfolio_to_float(
-                    self.portfolio_manager.portfolio_value_holder.origin_portfolio.portfolio
-                ))
+                self.starting_portfolio = portfolio_util.portfolio_to_float(
+                    self.portfolio_manager.portfolio_value_holder.origin_portfolio.portfolio, ignore_empty_values=True
+                )
 
     async def save_historical_portfolio_value(self, update_data=True, reset=False):
         if update_data:
@@ -57,22 +57,28 @@ def filter_empty_values(portfolio):
     }
 
 
-def portfolio_to_float(portfolio, use_wallet_balance_on_futures=False):
+def portfolio_to_float(portfolio, use_wallet_balance_on_futures=False, ignore_empty_values=False):
+    """
+    :param ignore_empty_values: when True, assets with a total that is not positive are skipped, which is equivalent
+    to filter_empty_values(portfolio_to_float(portfolio)) without a second iteration
+    """
     float_portfolio = {}
     for symbol, symbol_balance in portfolio.items():
         if (
             isinstance(symbol_balance, octobot_trading.personal_data.portfolios.assets.FutureAsset)
             and use_wallet_balance_on_futures
         ):
-            float_portfolio[symbol] = {
-                commons_constants.PORTFOLIO_AVAILABLE: float(symbol_balance.available),
-                commons_constants.PORTFOLIO_TOTAL: float(symbol_balance.wallet_balance)
-            }
+            total = float(symbol_balance.wallet_balance)
         elif isinstance(symbol_balance, asset.Asset):
-            float_portfolio[symbol] = {
-                commons_constants.PORTFOLIO_AVAILABLE: float(symbol_balance.available),
-                commons_constants.PORTFOLIO_TOTAL: float(symbol_balance.total)
-            }
+            total = float(symbol_balance.total)
+        else:
+            continue
+        if ignore_empty_values and not total > 0:
+            continue
+        float_portfolio[symbol] = {
+            commons_constants.PORTFOLIO_AVAILABLE: float(symbol_balance.available),
+            commons_constants.PORTFOLIO_TOTAL: total
+        }
     return float_portfolio
 
 
@@ -29,30 +29,57 @@ import octobot_commons.errors as commons_errors
 import octobot_commons.authentication as authentication
 
 
+class _DisabledSignalPublisher:
+    """
+    Stateless remote_signal_publisher context manager used when signals are not emitted
+    """
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and issubclass(exc_type, commons_errors.MissingSignalBuilder):
+            _log_missing_signal_builder(exc_val)
+            return True
+        return False
+
+
+_DISABLED_SIGNAL_PUBLISHER = _DisabledSignalPublisher()
+
+
+def remote_signal_publisher(exchange_manager, symbol: str, emit_trading_signals: bool):
+    if emit_trading_signals:
+        return _remote_signal_publisher(exchange_manager, symbol)
+    # signals are not emitted (always the case in backtesting): skip signal builder context creation
+    return _DISABLED_SIGNAL_PUBLISHER
+
+
 @contextlib.asynccontextmanager
-async def remote_signal_publisher(exchange_manager, symbol: str, emit_trading_signals: bool):
+async def _remote_signal_publisher(exchange_manager, symbol: str):
     try:
-        if emit_trading_signals:
-            try:
-                trading_mode = exchange_manager.trading_modes[0]
-            except IndexError:
-                yield None
-                return
-            try:
-                async with signals.SignalPublisher.instance().remote_signal_bundle_builder(
-                    symbol,
-                    trading_mode.get_trading_signal_identifier(),
-                    trading_mode.TRADING_SIGNAL_TIMEOUT,
-                    trading_signal_bundle_builder.TradingSignalBundleBuilder,
-                    (trading_mode.get_name(),)
-                ) as signal_builder:
-                    yield signal_builder
-            except (authentication.AuthenticationRequired, authentication.UnavailableError) as e:
-                logging.get_logger(__name__).exception(e, True, f"Failed to send trading signals: {e}")
-        else:
+        try:
+            trading_mode = exchange_manager.trading_modes[0]
+        except IndexError:
             yield None
+            return
+        try:
+            async with signals.SignalPublisher.instance().remote_signal_bundle_builder(
+                symbol,
+                trading_mode.get_trading_signal_identifier(),
+                trading_mode.TRADING_SIGNAL_TIMEOUT,
+                trading_signal_bundle_builder.TradingSignalBundleBuilder,
+                (trading_mode.get_name(),)
+            ) as signal_builder:
+                yield signal_builder
+        except (authentication.AuthenticationRequired, authentication.UnavailableError) as e:
+            logging.get_logger(__name__).exception(e, True, f"Failed to send trading signals: {e}")
     except commons_errors.MissingSignalBuilder as e:
-        logging.get_logger(__name__).exception(e, True, f"Error when sending trading signal: no signal builder {e}")
+        _log_missing_signal_builder(e)
+
+
+def _log_missing_signal_builder(error):
+    logging.get_logger(__name__).exception(
+        error, True, f"Error when sending trading signal: no signal builder {error}"
+    )
 
 
 def should_emit_trading_signal(exchange_manager):
@@ -26,6 +26,11 @@ import octobot_trading.storage.abstract_storage as abstract_storage
 import octobot_trading.storage.util as storage_util
 
 
+_STATUS_KEY = enums.ExchangeConstantsOrderColumns.STATUS.value
+_ID_KEY = enums.ExchangeConstantsOrderColumns.ID.value
+_CANCELED_STATUS = enums.OrderStatus.CANCELED.value
+
+
 class TradesStorage(abstract_storage.AbstractStorage):
     LIVE_CHANNEL = channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value
     HISTORY_TABLE = commons_enums.DBTables.TRADES.value
@@ -40,7 +45,7 @@ class TradesStorage(abstract_storage.AbstractStorage):
         trade: dict,
         old_trade: bool
     ):
-        if trade[enums.ExchangeConstantsOrderColumns.STATUS.value] != enums.OrderStatus.CANCELED.value:
+        if trade[_STATUS_KEY] != _CANCELED_STATUS:
             await self._get_db().log(
                 self.HISTORY_TABLE,
                 _format_trade(
@@ -53,7 +58,7 @@ class TradesStorage(abstract_storage.AbstractStorage):
                 )
             )
             await self.trigger_debounced_flush()
-            self._to_update_auth_data_ids_buffer.add(trade[enums.ExchangeConstantsOrderColumns.ID.value])
+            self._to_update_auth_data_ids_buffer.add(trade[_ID_KEY])
             await self.trigger_debounced_update_auth_data(False)
 
     async def _update_auth_data(self, reset):
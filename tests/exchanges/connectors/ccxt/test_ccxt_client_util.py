@@ -0,0 +1,228 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import mock
+import pytest
+import ccxt
+import ccxt.async_support as async_ccxt
+
+import octobot_trading.constants as constants
+import octobot_trading.exchanges.config.proxy_config as proxy_config
+import octobot_trading.exchanges.connectors.ccxt.ccxt_client_util as ccxt_client_util
+import octobot_trading.exchanges.connectors.ccxt.ccxt_clients_cache as ccxt_clients_cache
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_instantiate_exchange_with_shared_connector():
+    clients = []
+    try:
+        with mock.patch.object(constants, "ENABLE_CCXT_SHARED_CONNECTOR", True):
+            clients = [
+                ccxt_client_util.instantiate_exchange(exchange_class, {}, "", proxy_config.ProxyConfig())
+                for exchange_class in (async_ccxt.binance, async_ccxt.kucoin)
+            ]
+        connector = clients[0].session.connector
+        assert clients[1].session.connector is connector
+        assert connector.limit == constants.CCXT_SHARED_CONNECTOR_LIMIT
+        assert connector.limit_per_host == constants.CCXT_SHARED_CONNECTOR_LIMIT_PER_HOST
+        # closing a client, even without close_client, does not close the shared connector
+        await clients[0].close()
+        assert clients[0].session is None
+        assert not connector.closed
+        assert not clients[1].session.closed
+        # closing the last client closes the shared connector
+        await ccxt_client_util.close_client(clients[1])
+        assert connector.closed
+        assert ccxt_client_util._SHARED_CONNECTORS_BY_LOOP == {}
+    finally:
+        for client in clients:
+            await client.close()
+        await ccxt_client_util.close_shared_connectors()
+
+
+async def test_instantiate_exchange_with_shared_connector_without_running_loop():
+    client = None
+    try:
+        with mock.patch.object(constants, "ENABLE_CCXT_SHARED_CONNECTOR", True):
+            # no running loop in this thread
+            client = await asyncio.to_thread(
+                ccxt_client_util.instantiate_exchange, async_ccxt.binance, {}, "", proxy_config.ProxyConfig()
+            )
+        # session is created by ccxt when required
+        assert client.session is None
+        assert ccxt_client_util._SHARED_CONNECTORS_BY_LOOP == {}
+    finally:
+        if client is not None:
+            await client.close()
+
+
+async def test_close_shared_connectors():
+    client = None
+    try:
+        with mock.patch.object(constants, "ENABLE_CCXT_SHARED_CONNECTOR", True):
+            client = ccxt_client_util.instantiate_exchange(async_ccxt.binance, {}, "", proxy_config.ProxyConfig())
+        connector = client.session.connector
+        closed_loop = mock.Mock(is_closed=mock.Mock(return_value=True))
+        ccxt_client_util._SHARED_CONNECTORS_BY_LOOP[closed_loop] = {}
+        await ccxt_client_util.close_shared_connectors()
+        assert connector.closed
+        assert ccxt_client_util._SHARED_CONNECTORS_BY_LOOP == {}
+        # releasing an already closed connector is a no-op
+        await ccxt_client_util.close_client(client)
+    finally:
+        if client is not None:
+            await client.close()
+
+
+async def test_instantiate_exchange_without_shared_connector():
+    client = None
+    try:
+        with mock.patch.object(constants, "ENABLE_CCXT_SHARED_CONNECTOR", False):
+            client = ccxt_client_util.instantiate_exchange(async_ccxt.binance, {}, "", proxy_config.ProxyConfig())
+        # session is created by ccxt when required
+        assert client.session is None
+    finally:
+        if client is not None:
+            await client.close()
+
+
+async def test_get_market_fields():
+    client = mock.Mock(markets={
+        "BTC/USDT": {"id": "BTCUSDT", "base": "BTC", "quote": "USDT"},
+        "ETH/USDT": {"id": "ETHUSDT"},
+    })
+    assert ccxt_client_util.get_market_fields(client, "BTC/USDT", ("id", "base")) == ("BTCUSDT", "BTC")
+    assert ccxt_client_util.get_exchange_pair(client, "BTC/USDT") == "BTCUSDT"
+    assert ccxt_client_util.get_pair_cryptocurrency(client, "BTC/USDT") == "BTC"
+    with pytest.raises(ValueError):
+        ccxt_client_util.get_pair_cryptocurrency(client, "ETH/USDT")
+    with pytest.raises(ValueError):
+        ccxt_client_util.get_exchange_pair(client, "SOL/USDT")
+    client.markets = None
+    with pytest.raises(ValueError):
+        ccxt_client_util.get_exchange_pair(client, "BTC/USDT")
+
+
+async def test_load_clients_markets_concurrently():
+    markets = {"BTC/USDT": {"id": "BTCUSDT", "symbol": "BTC/USDT"}}
+
+    def _load_markets_side_effect(client):
+        async def _load_markets(reload=False):
+            client.markets = markets
+        return _load_markets
+
+    cached_client = mock.Mock(markets=markets)
+    loaded_client = mock.Mock(markets={})
+    loaded_client.load_markets = mock.AsyncMock(side_effect=_load_markets_side_effect(loaded_client))
+    failing_client = mock.Mock(load_markets=mock.AsyncMock(side_effect=ccxt.ExchangeNotAvailable("error")))
+
+    def _load_markets_from_cache(client, market_filter=None):
+        if client is not cached_client:
+            raise KeyError("not cached")
+
+    with mock.patch.object(ccxt_client_util, "load_markets_from_cache",
+                           mock.Mock(side_effect=_load_markets_from_cache)) as load_markets_from_cache_mock, \
+         mock.patch.object(ccxt_client_util, "set_markets_cache", mock.Mock()) as set_markets_cache_mock:
+        results = await ccxt_client_util.load_clients_markets_concurrently(
+            [cached_client, loaded_client, failing_client]
+        )
+        assert results[:2] == [markets, markets]
+        assert isinstance(results[2], ccxt.ExchangeNotAvailable)
+        assert load_markets_from_cache_mock.call_count == 3
+        cached_client.load_markets.assert_not_called()
+        loaded_client.load_markets.assert_awaited_once_with(reload=False)
+        set_markets_cache_mock.assert_called_once_with(loaded_client)
+
+
+async def test_copied_markets():
+    markets = [{
+        "id": "BTCUSDT",
+        "limits": {"amount": {"min": 0.0001, "max": None}},
+        "info": {"filters": [{"filterType": "PRICE_FILTER"}]},
+    }]
+    for orjson in (ccxt_client_util.orjson, None):
+        with mock.patch.object(ccxt_client_util, "orjson", orjson):
+            copied = ccxt_client_util._copied_markets(markets)
+        assert copied == markets
+        assert copied[0] is not markets[0]
+        assert copied[0]["limits"]["amount"] is not markets[0]["limits"]["amount"]
+        assert copied[0]["info"]["filters"][0] is not markets[0]["info"]["filters"][0]
+
+
+async def test_cached_client_key_with_sandbox():
+    client = async_ccxt.binance()
+    try:
+        key = ccxt_client_util._cached_client_key(client)
+        assert ccxt_client_util._cached_client_key(client) is key
+        # enabling sandbox mode replaces api urls: key has to change
+        client.set_sandbox_mode(True)
+        sandbox_key = ccxt_client_util._cached_client_key(client)
+        assert sandbox_key != key
+        assert sandbox_key == ccxt_clients_cache.get_client_key(client)
+        client.set_sandbox_mode(False)
+        assert ccxt_client_util._cached_client_key(client) == key
+    finally:
+        await client.close()
+
+
+def _market(symbol, active):
+    base, quote = symbol.split("/")
+    return {
+        "id": symbol.replace("/", ""), "symbol": symbol, "base": base, "quote": quote, "active": active,
+        "spot": True, "linear": None, "inverse": None, "contract": False,
+    }
+
+
+async def test_get_symbols_cache():
+    client = async_ccxt.binance()
+    try:
+        client.set_markets([_market("BTC/USDT", True), _market("ETH/USDT", False)])
+        active_symbols = ccxt_client_util.get_symbols(client, True)
+        assert active_symbols == frozenset({"BTC/USDT"})
+        assert ccxt_client_util.get_symbols(client, False) == frozenset({"BTC/USDT", "ETH/USDT"})
+        # cache hit
+        with mock.patch.object(ccxt_client_util, "_get_symbols", mock.Mock()) as _get_symbols_mock:
+            assert ccxt_client_util.get_symbols(client, True) is active_symbols
+            _get_symbols_mock.assert_not_called()
+        # in place market update: requires clear_client_values_cache
+        client.markets["ETH/USDT"]["active"] = True
+        assert ccxt_client_util.get_symbols(client, True) is active_symbols
+        ccxt_client_util.clear_client_values_cache(client)
+        assert ccxt_client_util.get_symbols(client, True) == frozenset({"BTC/USDT", "ETH/USDT"})
+        # reloaded markets: cache miss
+        client.set_markets([_market("BTC/USDT", False), _market("SOL/USDT", True)])
+        assert ccxt_client_util.get_symbols(client, True) == frozenset({"SOL/USDT"})
+        assert ccxt_client_util.get_symbols(client, False) == frozenset({"BTC/USDT", "SOL/USDT"})
+        # closed client: cache is cleared
+        await ccxt_client_util.close_client(client)
+        assert ccxt_client_util.get_symbols(client, True) == frozenset()
+        assert ccxt_client_util.get_symbols(client, False) == frozenset()
+    finally:
+        await client.close()
+
+
+async def test_get_time_frames_cache():
+    client = async_ccxt.binance()
+    try:
+        time_frames = ccxt_client_util.get_time_frames(client)
+        assert "1h" in time_frames
+        assert ccxt_client_util.get_time_frames(client) is time_frames
+        client.timeframes = {"1h": "1h"}
+        assert ccxt_client_util.get_time_frames(client) == frozenset({"1h"})
+    finally:
+        await client.close()
@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import time
+import mock
+import pytest
+import ccxt
+
+import octobot_trading.constants as constants
+import octobot_trading.exchanges.connectors.ccxt.ccxt_clients_cache as ccxt_clients_cache
+
+
+CLIENT_KEY = 'binance:{"public": "https://api.binance.com/api/v3"}'
+MARKETS = [{"id": "BTCUSDT", "symbol": "BTC/USDT", "limits": {"amount": {"min": 0.0001, "max": None}}}]
+
+
+@pytest.fixture
+def disk_cache_folder(tmp_path):
+    with mock.patch.object(constants, "ENABLE_CCXT_MARKETS_DISK_CACHE", True), \
+         mock.patch.object(constants, "CCXT_MARKETS_DISK_CACHE_FOLDER", str(tmp_path)), \
+         mock.patch.object(ccxt_clients_cache, "_MARKETS_BY_EXCHANGE", {}):
+        yield tmp_path
+
+
+def test_get_exchange_parsed_markets_without_disk_cache(tmp_path):
+    with mock.patch.object(constants, "ENABLE_CCXT_MARKETS_DISK_CACHE", False), \
+         mock.patch.object(constants, "CCXT_MARKETS_DISK_CACHE_FOLDER", str(tmp_path)), \
+         mock.patch.object(ccxt_clients_cache, "_MARKETS_BY_EXCHANGE", {}) as markets_by_exchange:
+        ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+        assert os.listdir(tmp_path) == []
+        markets_by_exchange.clear()
+        with pytest.raises(KeyError):
+            ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
+
+
+def test_get_exchange_parsed_markets_from_disk_cache(disk_cache_folder):
+    with pytest.raises(KeyError):
+        ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
+    ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    assert len(os.listdir(disk_cache_folder)) == 1
+    # simulate a new process
+    ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+    assert ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY) == MARKETS
+    # now also in memory, until the disk cache expiration
+    markets, expiration = ccxt_clients_cache._MARKETS_BY_EXCHANGE[CLIENT_KEY]
+    assert markets == MARKETS
+    path = ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY)
+    assert expiration == os.path.getmtime(path) + ccxt_clients_cache._CACHE_TIME
+
+
+@pytest.mark.parametrize("orjson", [ccxt_clients_cache.orjson, None])
+def test_get_exchange_parsed_markets_from_disk_cache_json_libraries(disk_cache_folder, orjson):
+    with mock.patch.object(ccxt_clients_cache, "orjson", orjson):
+        ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+        ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+        assert ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY) == MARKETS
+
+
+def test_get_exchange_parsed_markets_from_old_disk_cache_remaining_time(disk_cache_folder):
+    with mock.patch.object(
+        ccxt_clients_cache, "_MARKETS_BY_EXCHANGE", ccxt_clients_cache.cachetools.TLRUCache(
+            maxsize=50, ttu=ccxt_clients_cache._get_markets_expiration, timer=lambda: time.time()
+        )
+    ):
+        ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+        ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+        path = ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY)
+        # cache file is about to expire
+        old_time = time.time() - ccxt_clients_cache._CACHE_TIME + 10
+        os.utime(path, (old_time, old_time))
+        assert ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY) == MARKETS
+        # in memory markets expire at the same time as the disk cache instead of _CACHE_TIME later
+        with mock.patch.object(time, "time", mock.Mock(return_value=old_time + ccxt_clients_cache._CACHE_TIME + 1)):
+            with pytest.raises(KeyError):
+                ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
+
+
+def test_write_disk_cached_markets_temporary_files(disk_cache_folder):
+    ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    # temporary file is unique and not left behind
+    with mock.patch.object(ccxt_clients_cache.tempfile, "NamedTemporaryFile",
+                           mock.Mock(wraps=ccxt_clients_cache.tempfile.NamedTemporaryFile)) as temp_file_mock:
+        ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+        temp_file_mock.assert_called_once_with(dir=str(disk_cache_folder), suffix=".tmp", delete=False)
+    assert os.listdir(disk_cache_folder) == [os.path.basename(ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY))]
+    # failed writes also remove their temporary file
+    with mock.patch.object(ccxt_clients_cache, "_dumps", mock.Mock(side_effect=TypeError)):
+        ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    assert os.listdir(disk_cache_folder) == [os.path.basename(ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY))]
+
+
+def test_get_exchange_parsed_markets_from_other_ccxt_version_disk_cache(disk_cache_folder):
+    ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+    with mock.patch.object(ccxt, "__version__", "0.0.1"):
+        # cached markets have been parsed by another ccxt version
+        with pytest.raises(KeyError):
+            ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
+    assert ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY) == MARKETS
+
+
+def test_get_exchange_parsed_markets_from_expired_disk_cache(disk_cache_folder):
+    ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+    path = ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY)
+    expired_time = os.path.getmtime(path) - ccxt_clients_cache._CACHE_TIME - 1
+    os.utime(path, (expired_time, expired_time))
+    with pytest.raises(KeyError):
+        ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
+
+
+def test_get_exchange_parsed_markets_from_invalid_disk_cache(disk_cache_folder):
+    ccxt_clients_cache.set_exchange_parsed_markets(CLIENT_KEY, MARKETS)
+    ccxt_clients_cache._MARKETS_BY_EXCHANGE.clear()
+    with open(ccxt_clients_cache._get_disk_cache_path(CLIENT_KEY), "w") as cache_file:
+        cache_file.write("{invalid")
+    with pytest.raises(KeyError):
+        ccxt_clients_cache.get_exchange_parsed_markets(CLIENT_KEY)
@@ -14,10 +14,16 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import mock
 import pytest
 from octobot_backtesting.backtesting import Backtesting
 
+import octobot_commons.configuration as configuration
+import octobot_commons.constants as commons_constants
 from octobot_commons.tests.test_config import load_test_config
+import octobot_trading.constants as constants
+import octobot_trading.exchanges as exchanges
+import octobot_trading.exchanges.connectors.ccxt.ccxt_client_util as ccxt_client_util
 from octobot_trading.exchanges.exchange_manager import ExchangeManager
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 from octobot_trading.exchanges.types import RestExchange
@@ -114,3 +120,48 @@ class TestExchangeManager:
         assert exchange_manager.is_ready
         cancel_ccxt_throttle_task()
         await exchange_manager.stop()
+
+    async def test_stop_closes_shared_connectors(self):
+        config = load_test_config()
+        exchange_manager = ExchangeManager(config, TestExchangeManager.EXCHANGE_NAME)
+        other_exchange_manager = ExchangeManager(config, TestExchangeManager.EXCHANGE_NAME)
+        for manager in (exchange_manager, other_exchange_manager):
+            manager.exchange = mock.Mock(stop=mock.AsyncMock())
+            manager.exchange.name = TestExchangeManager.EXCHANGE_NAME
+        registered_exchanges = {
+            TestExchangeManager.EXCHANGE_NAME: {
+                manager.id: mock.Mock() for manager in (exchange_manager, other_exchange_manager)
+            }
+        }
+        with mock.patch.object(constants, "ENABLE_CCXT_SHARED_CONNECTOR", True), \
+             mock.patch.object(exchanges.Exchanges.instance(), "exchanges", registered_exchanges), \
+             mock.patch.object(ccxt_client_util, "close_shared_connectors", mock.AsyncMock()) \
+             as close_shared_connectors_mock:
+            await exchange_manager.stop()
+            # other exchange is still running
+            close_shared_connectors_mock.assert_not_awaited()
+            await other_exchange_manager.stop()
+            close_shared_connectors_mock.assert_awaited_once()
+
+    async def test_get_exchange_credentials(self):
+        config = load_test_config()
+        exchange_manager = ExchangeManager(config, TestExchangeManager.EXCHANGE_NAME)
+        config_exchange = config[commons_constants.CONFIG_EXCHANGES][TestExchangeManager.EXCHANGE_NAME]
+        config_exchange[commons_constants.CONFIG_EXCHANGE_KEY] = configuration.encrypt("key1").decode()
+        config_exchange[commons_constants.CONFIG_EXCHANGE_SECRET] = configuration.encrypt("secret1").decode()
+        with mock.patch.object(exchange_manager, "should_decrypt_token", mock.Mock(return_value=True)), \
+             mock.patch.object(configuration, "decrypt_element_if_possible",
+                               mock.Mock(wraps=configuration.decrypt_element_if_possible)) as decrypt_mock:
+            assert exchange_manager.get_exchange_credentials(TestExchangeManager.EXCHANGE_NAME)[:2] == \
+                   ("key1", "secret1")
+            # key, secret and password
+            assert decrypt_mock.call_count == 3
+            # credentials are not decrypted again
+            assert exchange_manager.get_exchange_credentials(TestExchangeManager.EXCHANGE_NAME)[:2] == \
+                   ("key1", "secret1")
+            assert decrypt_mock.call_count == 3
+            # updated config: decrypt again
+            config_exchange[commons_constants.CONFIG_EXCHANGE_KEY] = configuration.encrypt("key2").decode()
+            assert exchange_manager.get_exchange_credentials(TestExchangeManager.EXCHANGE_NAME)[:2] == \
+                   ("key2", "secret1")
+            assert decrypt_mock.call_count == 6
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import os
 import pytest
 import mock
 import asyncio
@@ -28,6 +29,10 @@ import octobot_commons.errors as common_errors
 import octobot_commons.asyncio_tools as asyncio_tools
 import octobot_commons.signals.signals_emitter as signals_emitter
 import octobot_trading.exchanges.util.exchange_util as exchange_util
+import octobot_trading.exchange_channel as exchanges_channel
+import async_channel.constants as channel_constants
+import octobot_tentacles_manager.api as tentacles_manager_api
+import octobot_tentacles_manager.configuration as tm_configuration
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
@@ -277,6 +282,162 @@ async def test_optimize_initial_portfolio_single_call(trading_mode):
         assert mode_2_orders == []
 
 
+async def test_cached_tentacle_config(trading_mode, tmp_path):
+    tentacles_setup_config = mock.Mock(get_config_folder=mock.Mock(return_value=str(tmp_path)))
+    modes.invalidate_tentacle_config_cache()
+    with mock.patch.object(
+        tentacles_manager_api, "get_tentacle_config",
+        mock.Mock(return_value={
+            constants.CONFIG_CANDLES_HISTORY_SIZE_KEY: 12,
+            constants.TRADING_MODE_REQUIRED_STRATEGIES: ["strategy_1"],
+        })
+    ) as get_tentacle_config_mock:
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        get_tentacle_config_mock.assert_called_once_with(tentacles_setup_config, modes.AbstractTradingMode)
+        # other tentacles setup config
+        other_tentacles_setup_config = mock.Mock(get_config_folder=mock.Mock(return_value=str(tmp_path)))
+        assert modes.AbstractTradingMode.get_required_candles_count(other_tentacles_setup_config) == 12
+        assert get_tentacle_config_mock.call_count == 2
+        get_tentacle_config_mock.reset_mock()
+        # cached values can't be altered by callers
+        modes.AbstractTradingMode.get_default_strategies(tentacles_setup_config).append("strategy_2")
+        assert modes.AbstractTradingMode.get_default_strategies(tentacles_setup_config) == ["strategy_1"]
+        get_tentacle_config_mock.assert_not_called()
+        # reloading config does not invalidate cache
+        with mock.patch.object(trading_mode, "load_and_save_user_inputs", mock.AsyncMock()):
+            await trading_mode.reload_config(trading_mode.exchange_manager.bot_id)
+        get_tentacle_config_mock.reset_mock()
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        get_tentacle_config_mock.assert_not_called()
+        # updating tentacle config file invalidates cache
+        config_path = tm_configuration.get_profile_config_specific_file_path(
+            tentacles_setup_config, modes.AbstractTradingMode
+        )
+        os.makedirs(os.path.dirname(config_path))
+        with open(config_path, "w") as config_file:
+            config_file.write("{}")
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        get_tentacle_config_mock.assert_called_once_with(tentacles_setup_config, modes.AbstractTradingMode)
+        get_tentacle_config_mock.reset_mock()
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        get_tentacle_config_mock.assert_not_called()
+        updated_time = os.path.getmtime(config_path) + 10
+        os.utime(config_path, (updated_time, updated_time))
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 12
+        get_tentacle_config_mock.assert_called_once_with(tentacles_setup_config, modes.AbstractTradingMode)
+    modes.invalidate_tentacle_config_cache()
+
+
+async def test_cached_tentacle_config_with_config_proxy(tmp_path):
+    tentacles_setup_config = mock.Mock(get_config_folder=mock.Mock(return_value=str(tmp_path)))
+    config_path = tm_configuration.get_profile_config_specific_file_path(
+        tentacles_setup_config, modes.AbstractTradingMode
+    )
+    os.makedirs(os.path.dirname(config_path))
+    with open(config_path, "w") as config_file:
+        config_file.write(f'{{"{constants.CONFIG_CANDLES_HISTORY_SIZE_KEY}": 100}}')
+    modes.invalidate_tentacle_config_cache()
+    proxy = mock.Mock(return_value={constants.CONFIG_CANDLES_HISTORY_SIZE_KEY: 5})
+    # file system config is cached
+    assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 100
+    with tentacles_manager_api.local_tentacle_config_proxy(proxy):
+        # proxied configs are used and never cached
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 5
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 5
+        assert proxy.call_count == 2
+    # proxied configs did not replace cached file system configs
+    assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 100
+    modes.invalidate_tentacle_config_cache()
+    with tentacles_manager_api.local_tentacle_config_proxy(proxy):
+        assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 5
+    # proxied configs read first are not cached either
+    assert modes.AbstractTradingMode.get_required_candles_count(tentacles_setup_config) == 100
+    modes.invalidate_tentacle_config_cache()
+
+
+async def test_get_parent_trading_mode_classes():
+    class ParentMode(modes.AbstractTradingMode):
+        pass
+
+    class ChildMode(ParentMode):
+        pass
+
+    assert ChildMode.get_parent_trading_mode_classes() == [ChildMode, ParentMode, modes.AbstractTradingMode]
+    assert ChildMode.get_parent_trading_mode_classes(ParentMode) == [ChildMode, ParentMode]
+    # cached values can't be altered by callers
+    ChildMode.get_parent_trading_mode_classes().clear()
+    assert ChildMode.get_parent_trading_mode_classes() == [ChildMode, ParentMode, modes.AbstractTradingMode]
+    assert ParentMode.get_parent_trading_mode_classes() == [ParentMode, modes.AbstractTradingMode]
+
+
+async def test_stop(trading_mode):
+    trading_mode.producers = [mock.Mock(stop=mock.AsyncMock()), mock.Mock(stop=mock.AsyncMock())]
+    trading_mode.consumers = [mock.Mock(stop=mock.AsyncMock())]
+    await trading_mode.stop()
+    for element in trading_mode.producers + trading_mode.consumers:
+        element.stop.assert_awaited_once()
+    assert trading_mode.exchange_manager is None
+
+
+async def test_create_producers_and_consumers_order(trading_mode):
+    mode_classes = [mock.Mock(), mock.Mock(), mock.Mock()]
+
+    async def create_element(mode_class, *_):
+        # first classes are created last
+        for _ in range(len(mode_classes) - mode_classes.index(mode_class)):
+            await asyncio_tools.wait_asyncio_next_cycle()
+        return mode_class.return_value
+
+    with mock.patch.object(trading_mode, "get_mode_producer_classes", mock.Mock(return_value=mode_classes)), \
+         mock.patch.object(trading_mode, "_create_mode_producer", mock.AsyncMock(side_effect=create_element)):
+        assert await trading_mode.create_producers(False) == [mode_class.return_value for mode_class in mode_classes]
+    with mock.patch.object(trading_mode, "get_mode_consumer_classes", mock.Mock(return_value=mode_classes)), \
+         mock.patch.object(trading_mode, "_create_mode_consumer", mock.AsyncMock(side_effect=create_element)), \
+         mock.patch.object(trading_mode, "_create_user_input_consumer", mock.AsyncMock(return_value="user_input")):
+        assert await trading_mode.create_consumers() == \
+               [mode_class.return_value for mode_class in mode_classes] + ["user_input"]
+
+
+async def test_create_producers_error(trading_mode):
+    created_producers = [mock.Mock(stop=mock.AsyncMock()), mock.Mock(stop=mock.AsyncMock(side_effect=ValueError))]
+    with mock.patch.object(trading_mode, "get_mode_producer_classes", mock.Mock(return_value=[1, 2, 3])), \
+         mock.patch.object(trading_mode, "_create_mode_producer", mock.AsyncMock(
+             side_effect=[created_producers[0], KeyError("creation error"), created_producers[1]]
+         )):
+        with pytest.raises(KeyError, match="creation error"):
+            await trading_mode.create_producers(True)
+    # successfully created producers are stopped, even when one of them fails to stop
+    for producer in created_producers:
+        producer.stop.assert_awaited_once()
+
+
+async def test_create_mode_consumer_channel_filters(trading_mode):
+    mode_chan = mock.Mock(new_consumer=mock.AsyncMock())
+    consumer_class = mock.Mock()
+    with mock.patch.object(exchanges_channel, "get_chan", mock.Mock(return_value=mode_chan)):
+        await trading_mode._create_mode_consumer(consumer_class)
+        mode_chan.new_consumer.assert_awaited_once_with(
+            consumer_instance=consumer_class.return_value,
+            trading_mode_name=trading_mode.get_name(),
+            cryptocurrency=channel_constants.CHANNEL_WILDCARD,
+            symbol=channel_constants.CHANNEL_WILDCARD,
+            time_frame=channel_constants.CHANNEL_WILDCARD
+        )
+        mode_chan.new_consumer.reset_mock()
+        # filters use the current mode values, even when set after the mode creation
+        trading_mode.cryptocurrency = "Bitcoin"
+        trading_mode.symbol = "BTC/USDT"
+        await trading_mode._create_mode_consumer(consumer_class)
+        mode_chan.new_consumer.assert_awaited_once_with(
+            consumer_instance=consumer_class.return_value,
+            trading_mode_name=trading_mode.get_name(),
+            cryptocurrency="Bitcoin",
+            symbol="BTC/USDT",
+            time_frame=channel_constants.CHANNEL_WILDCARD
+        )
+
+
 def _get_trading_mode(simulated_trader):
     config, exchange_manager_inst, trader_inst = simulated_trader
     mode = modes.AbstractTradingMode(config, exchange_manager_inst)
@@ -0,0 +1,42 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import octobot_commons.constants as commons_constants
+
+import octobot_trading.constants as constants
+import octobot_trading.personal_data.portfolios.assets.spot_asset as spot_asset
+import octobot_trading.personal_data.portfolios.portfolio_util as portfolio_util
+
+
+def test_portfolio_to_float():
+    portfolio = {
+        "BTC": spot_asset.SpotAsset("BTC", decimal.Decimal("0.5"), decimal.Decimal("1.5")),
+        "ETH": spot_asset.SpotAsset("ETH", constants.ZERO, constants.ZERO),
+        "USDT": spot_asset.SpotAsset("USDT", decimal.Decimal(100), decimal.Decimal(100)),
+    }
+    float_portfolio = portfolio_util.portfolio_to_float(portfolio)
+    assert float_portfolio == {
+        "BTC": {commons_constants.PORTFOLIO_AVAILABLE: 0.5, commons_constants.PORTFOLIO_TOTAL: 1.5},
+        "ETH": {commons_constants.PORTFOLIO_AVAILABLE: 0, commons_constants.PORTFOLIO_TOTAL: 0},
+        "USDT": {commons_constants.PORTFOLIO_AVAILABLE: 100, commons_constants.PORTFOLIO_TOTAL: 100},
+    }
+    assert portfolio_util.portfolio_to_float(portfolio, ignore_empty_values=True) \
+        == portfolio_util.filter_empty_values(float_portfolio) \
+        == {
+            "BTC": {commons_constants.PORTFOLIO_AVAILABLE: 0.5, commons_constants.PORTFOLIO_TOTAL: 1.5},
+            "USDT": {commons_constants.PORTFOLIO_AVAILABLE: 100, commons_constants.PORTFOLIO_TOTAL: 100},
+        }
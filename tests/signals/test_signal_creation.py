@@ -0,0 +1,37 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.errors as commons_errors
+
+import octobot_trading.signals as signals
+
+
+@pytest.mark.asyncio
+async def test_remote_signal_publisher_without_signals():
+    exchange_manager = mock.Mock(trading_modes=[])
+    async with signals.remote_signal_publisher(exchange_manager, "BTC/USDT", False) as signal_builder:
+        assert signal_builder is None
+    # missing signal builder errors are logged, not raised
+    async with signals.remote_signal_publisher(exchange_manager, "BTC/USDT", False):
+        raise commons_errors.MissingSignalBuilder("error")
+    with pytest.raises(ZeroDivisionError):
+        async with signals.remote_signal_publisher(exchange_manager, "BTC/USDT", False):
+            1 / 0
+    # no trading mode to emit signals from
+    async with signals.remote_signal_publisher(exchange_manager, "BTC/USDT", True) as signal_builder:
+        assert signal_builder is None